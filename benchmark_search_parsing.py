@@ -0,0 +1,78 @@
+"""Compare peak memory of json.loads against SearchResponseStream on large search pages
+
+Usage:
+    python benchmark_search_parsing.py [items_per_page ...]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from nexus_package_manager_demo_nexus import SearchResponseStream, STREAM_CHUNK_SIZE
+
+def make_search_page(item_count):
+    """Build a Nexus-style search response body with realistic per-item asset payloads"""
+    items = []
+    for i in range(item_count):
+        name = f'Package.{i % 500}'
+        version = f'1.{i // 500}.{i % 7}'
+        items.append({
+            'id': f'bnVnZXQtZGV2OjE{i:08d}',
+            'repository': 'nuget-dev',
+            'format': 'nuget',
+            'group': None,
+            'name': name,
+            'version': version,
+            'assets': [{
+                'downloadUrl': f'http://localhost:8081/repository/nuget-dev/{name}/{version}',
+                'path': f'{name}/{version}',
+                'id': f'bnVnZXQtZGV2OjA{i:08d}',
+                'repository': 'nuget-dev',
+                'format': 'nuget',
+                'checksum': {
+                    'sha1': f'{i:040x}',
+                    'sha512': f'{i:0128x}',
+                    'sha256': f'{i:064x}',
+                },
+                'contentType': 'application/zip',
+                'lastModified': '2024-01-01T00:00:00.000+00:00',
+                'fileSize': 1024 * (i % 97 + 1),
+                'nuget': {'description': 'Benchmark package ' * 8, 'authors': 'Nexus'},
+            }],
+        })
+    return json.dumps({'items': items, 'continuationToken': 'abc123'}).encode('utf-8')
+
+def iter_chunks(body, chunk_size=STREAM_CHUNK_SIZE):
+    """Mimic response.iter_content() over an in-memory body"""
+    for start in range(0, len(body), chunk_size):
+        yield body[start:start + chunk_size]
+
+def parse_with_json(body):
+    data = json.loads(b''.join(iter_chunks(body)))
+    return [(item.get('name'), item.get('version')) for item in data.get('items', [])]
+
+def parse_with_stream(body):
+    stream = SearchResponseStream(iter_chunks(body))
+    return [(item['name'], item['version']) for item in stream]
+
+def measure(parse, body):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = parse(body)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+def main(sizes):
+    print(f"{'items':>8} {'payload':>10} {'json peak':>11} {'stream peak':>12} {'json s':>8} {'stream s':>9}")
+    for size in sizes:
+        body = make_search_page(size)
+        json_result, json_peak, json_time = measure(parse_with_json, body)
+        stream_result, stream_peak, stream_time = measure(parse_with_stream, body)
+        assert json_result == stream_result, 'Parsers disagree'
+        print(f"{size:>8} {len(body) / 2**20:>8.1f}MB {json_peak / 2**20:>9.1f}MB "
+              f"{stream_peak / 2**20:>10.1f}MB {json_time:>8.2f} {stream_time:>9.2f}")
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 50000])
@@ -0,0 +1,188 @@
+"""Install agent for Nexus Package Manager fleet mode
+
+Runs on each target host and executes install/uninstall jobs sent by the
+Nexus Package Manager dispatcher over HTTP. Uses only the standard library so
+it can be copied to build agents as a single file.
+
+Protocol (JSON over HTTP):
+    GET  /health  -> {"host": ..., "status": "ok", "busy": bool}
+    POST /jobs    {"action": "install"|"uninstall", "package": ..., "version": ...}
+                  -> {"host": ..., "action": ..., "package": ..., "version": ...,
+                      "returncode": int, "log": str, "duration": float}
+
+Jobs on one host run one at a time, since package managers do not tolerate
+concurrent installs. Requests must send the agent's token in the X-Agent-Token
+header; only --dry-run agents may run without one. The agent listens on
+localhost unless --bind says otherwise.
+
+Usage:
+    python nexus_install_agent.py --bind 0.0.0.0 --port 8765 --token SECRET
+    python nexus_install_agent.py --dry-run --count 5      # 5 local test agents on 8765-8769
+"""
+import argparse
+import hmac
+import json
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 8765
+# Same limit as the app's local installs
+JOB_TIMEOUT_SECONDS = 10800
+# Package names and versions are passed to the package manager, so only allow safe characters
+SAFE_ARGUMENT = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._+-]*$')
+
+def build_command(action, package_name, version):
+    """Return the Chocolatey command for a job, matching PackageFrame.install/uninstall"""
+    if action == 'install':
+        if version and version != 'N/A':
+            return ['choco', 'install', package_name, '--version', version, '-y']
+        return ['choco', 'install', package_name, '-y']
+    return ['choco', 'uninstall', package_name, '-y']
+
+class InstallAgent:
+    """Runs jobs for one host, one at a time"""
+
+    def __init__(self, name, dry_run=False, dry_run_seconds=2.0):
+        self.name = name
+        self.dry_run = dry_run
+        self.dry_run_seconds = dry_run_seconds
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self):
+        return self._lock.locked()
+
+    def run_job(self, job):
+        if not isinstance(job, dict):
+            raise ValueError('Job must be a JSON object')
+        action = job.get('action')
+        package_name = job.get('package', '')
+        version = job.get('version') or 'N/A'
+        if action not in ('install', 'uninstall'):
+            raise ValueError(f'Unknown action: {action!r}')
+        if not isinstance(package_name, str) or not SAFE_ARGUMENT.match(package_name):
+            raise ValueError(f'Invalid package name: {package_name!r}')
+        if version != 'N/A' and (not isinstance(version, str) or not SAFE_ARGUMENT.match(version)):
+            raise ValueError(f'Invalid version: {version!r}')
+
+        command = build_command(action, package_name, version)
+        with self._lock:
+            started = time.monotonic()
+            print(f"[{self.name}] Running command: {' '.join(command)}")
+            if self.dry_run:
+                time.sleep(self.dry_run_seconds)
+                returncode, log = 0, f"dry run: {' '.join(command)}\n"
+            else:
+                try:
+                    result = subprocess.run(command, capture_output=True, text=True, timeout=JOB_TIMEOUT_SECONDS)
+                    returncode, log = result.returncode, result.stdout + result.stderr
+                except subprocess.TimeoutExpired:
+                    returncode, log = -1, f'{action} timed out after {JOB_TIMEOUT_SECONDS} seconds\n'
+                except OSError as e:
+                    returncode, log = -1, f'Failed to run {command[0]}: {e}\n'
+            duration = time.monotonic() - started
+        print(f"[{self.name}] {action} {package_name} finished with {returncode} in {duration:.1f}s")
+        return {
+            'host': self.name,
+            'action': action,
+            'package': package_name,
+            'version': version,
+            'returncode': returncode,
+            'log': log,
+            'duration': duration,
+        }
+
+def make_handler(agent, token):
+    class AgentRequestHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _authorized(self):
+            if token is None:
+                return True
+            if hmac.compare_digest(self.headers.get('X-Agent-Token', ''), token):
+                return True
+            self._send_json(401, {'error': 'invalid agent token'})
+            return False
+
+        def do_GET(self):
+            if not self._authorized():
+                return
+            if self.path == '/health':
+                self._send_json(200, {'host': agent.name, 'status': 'ok', 'busy': agent.busy})
+            else:
+                self._send_json(404, {'error': 'not found'})
+
+        def do_POST(self):
+            if not self._authorized():
+                return
+            if self.path != '/jobs':
+                self._send_json(404, {'error': 'not found'})
+                return
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                job = json.loads(self.rfile.read(length) or b'{}')
+                self._send_json(200, agent.run_job(job))
+            except ValueError as e:
+                self._send_json(400, {'error': str(e)})
+            except Exception as e:
+                print(f"[{agent.name}] Job failed: {e}")
+                self._send_json(500, {'error': str(e)})
+
+    return AgentRequestHandler
+
+def serve(bind, port, agent, token):
+    server = ThreadingHTTPServer((bind, port), make_handler(agent, token))
+    server.daemon_threads = True
+    print(f"Install agent {agent.name} listening on {bind}:{port}")
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Nexus Package Manager install agent')
+    parser.add_argument('--bind', default='127.0.0.1',
+                        help='address to listen on (use 0.0.0.0 to accept jobs from other hosts)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='port to listen on')
+    parser.add_argument('--token', help='shared secret required in the X-Agent-Token header')
+    parser.add_argument('--name', default=socket.gethostname(), help='host name reported in results')
+    parser.add_argument('--dry-run', action='store_true', help='log commands instead of running them')
+    parser.add_argument('--dry-run-seconds', type=float, default=2.0, help='simulated job duration')
+    parser.add_argument('--count', type=int, default=1,
+                        help='start this many agents on consecutive ports (for local testing)')
+    args = parser.parse_args(argv)
+
+    if args.count > 1 and not args.dry_run:
+        parser.error('--count is only for local testing and requires --dry-run')
+    if not args.token and not args.dry_run:
+        parser.error('--token is required unless --dry-run is given')
+
+    servers = []
+    for i in range(args.count):
+        name = args.name if args.count == 1 else f'{args.name}-{i + 1}'
+        agent = InstallAgent(name, args.dry_run, args.dry_run_seconds)
+        servers.append(serve(args.bind, args.port + i, agent, args.token))
+    for server in servers[1:]:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        servers[0].serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.server_close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,22 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import requests
 from PIL import Image, ImageTk
 import os
 import sys
 import ctypes
+import codecs
+import contextlib
+import datetime
+import email.utils
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import traceback
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 def is_admin():
     """Check if the script is running with administrator privileges"""
@@ -41,8 +53,671 @@ REPOSITORY_NAMES = {
 # Base URL for getting package versions
 VERSION_BASE_URL = 'http://localhost:8081/service/rest/v1/search'
 
+# Size of the network reads used when streaming search responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Tabs hidden for longer than this have their widgets released (catalog is kept)
+TAB_IDLE_RELEASE_SECONDS = 300
+# How often hidden tabs are checked for release
+TAB_RECLAIM_CHECK_MS = 30 * 1000
+
+# Repositories with more packages than this are searched on the server instead of preloaded
+REMOTE_SEARCH_THRESHOLD = 2000
+# Number of recent (query, page) results kept in memory for remote search
+REMOTE_SEARCH_CACHE_SIZE = 64
+# Delay after the last keystroke before a remote search is sent
+REMOTE_SEARCH_DEBOUNCE_MS = 300
+# Load the next remote page once the list is scrolled past this fraction
+REMOTE_SEARCH_PREFETCH_FRACTION = 0.9
+
+# Path of the SQLite catalog database file; None keeps catalogs in memory only
+CATALOG_DB_PATH = None
+# Number of rows fetched per query when the list is backed by the catalog database
+CATALOG_PAGE_SIZE = 200
+
+# Adaptive limit on concurrent Nexus requests: starting point and bounds
+NEXUS_INITIAL_CONCURRENCY = 4
+NEXUS_MIN_CONCURRENCY = 1
+NEXUS_MAX_CONCURRENCY = 32
+# Multiplicative decrease applied on 429/503, errors or latency spikes
+NEXUS_BACKOFF_FACTOR = 0.5
+# Smoothed latency above this multiple of the baseline counts as congestion; the
+# baseline is the lowest smoothed latency over the last NEXUS_LATENCY_WINDOW responses
+NEXUS_LATENCY_TOLERANCE = 3.0
+NEXUS_LATENCY_SMOOTHING = 0.2
+NEXUS_LATENCY_WINDOW = 100
+# Retries for 429/503 responses, and the wait used when Retry-After is missing
+NEXUS_MAX_RETRIES = 3
+NEXUS_DEFAULT_RETRY_AFTER = 1.0
+
+# Install agents (host:port) available for fleet deployment; empty disables fleet mode
+FLEET_HOSTS = []
+# Shared secret sent to the agents in the X-Agent-Token header
+FLEET_AGENT_TOKEN = None
+# Per-job timeout for fleet installs, matching local installs
+FLEET_JOB_TIMEOUT = 10800
+
+# Main-loop watchdog: heartbeat period, lag that counts as a stall, and stack sampling period
+STALL_HEARTBEAT_MS = 50
+STALL_THRESHOLD_MS = 200
+STALL_SAMPLE_MS = 50
+# Number of recent stalls kept for the report, and stack samples kept per stall
+STALL_HISTORY_SIZE = 200
+STALL_MAX_SAMPLES = 100
+
+# Worker results are applied to widgets at most this many times a second,
+# spending at most this long per batch
+UI_PUMP_FPS = 30
+UI_PUMP_BUDGET_MS = 15
+
+# Package detail pane: rows prefetched on each side of the selection, cache size
+# limit, how long cached details stay valid, and where to keep them (None = memory only)
+DETAIL_PREFETCH_NEIGHBOURS = 2
+DETAIL_CACHE_MAX_BYTES = 4 * 1024 * 1024
+DETAIL_CACHE_TTL_SECONDS = 24 * 60 * 60
+DETAIL_CACHE_PATH = None
+
+class RemoteSearchRequired(Exception):
+    """Raised when a repository is too large to preload and must be searched remotely"""
+
+class AdaptiveConcurrencyLimiter:
+    """Limit concurrent Nexus requests, tuning the limit from what the server reports (AIMD)
+
+    Every successful response with normal latency from a request that ran at
+    the limit raises the limit by about one request per round trip; traffic
+    that never uses the whole limit does not grow it. Overload responses
+    (429/503), errors and a smoothed latency far above the recent baseline cut
+    it multiplicatively, at most once per round trip. A Retry-After header
+    pauses all new requests until it has passed.
+    """
+
+    def __init__(self, initial_limit=NEXUS_INITIAL_CONCURRENCY, min_limit=NEXUS_MIN_CONCURRENCY,
+                 max_limit=NEXUS_MAX_CONCURRENCY, latency_tolerance=NEXUS_LATENCY_TOLERANCE,
+                 backoff=NEXUS_BACKOFF_FACTOR):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiting = 0
+        self._smoothed_latency = None
+        self._recent_latency = deque(maxlen=NEXUS_LATENCY_WINDOW)
+        self._last_decrease = 0.0
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        """Current number of requests allowed in flight"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    @property
+    def queue_depth(self):
+        """Number of requests waiting for a slot"""
+        return self._waiting
+
+    def stats(self):
+        with self._condition:
+            return {
+                'limit': int(self._limit),
+                'in_flight': self._in_flight,
+                'queue_depth': self._waiting,
+                'paused_for': max(0.0, self._paused_until - time.monotonic()),
+            }
+
+    def acquire(self):
+        """Block until a request may start; returns the slot to pass to release()"""
+        with self._condition:
+            self._waiting += 1
+            try:
+                while True:
+                    pause = self._paused_until - time.monotonic()
+                    if pause > 0:
+                        self._condition.wait(pause)
+                    elif self._in_flight >= int(self._limit):
+                        self._condition.wait()
+                    else:
+                        break
+            finally:
+                self._waiting -= 1
+            self._in_flight += 1
+            # Only a request that filled the limit tells us the limit itself is sustainable
+            at_limit = self._in_flight >= int(self._limit)
+            return time.monotonic(), at_limit
+
+    def release(self, slot, latency=None, overloaded=False, error=False, retry_after=None):
+        """Give back a slot and adjust the limit from the request's outcome"""
+        started, at_limit = slot
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if overloaded or error or self._is_slow(latency):
+                # Only back off once per round trip: requests started before the
+                # last decrease were already accounted for by it
+                if started >= self._last_decrease:
+                    self._limit = max(self.min_limit, self._limit * self.backoff)
+                    self._last_decrease = now
+                    print(f"Nexus concurrency reduced to {self.limit}")
+            elif latency is not None and at_limit:
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+
+    def _is_slow(self, latency):
+        """Compare smoothed latency against the lowest smoothed latency seen recently
+
+        Smoothing keeps single slow responses from a server with naturally
+        varying latency from counting as congestion; the window lets the
+        baseline follow a server that has become permanently slower.
+        """
+        if latency is None:
+            return False
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += (latency - self._smoothed_latency) * NEXUS_LATENCY_SMOOTHING
+        self._recent_latency.append(self._smoothed_latency)
+        return self._smoothed_latency > min(self._recent_latency) * self.latency_tolerance
+
+def parse_retry_after(value, default=NEXUS_DEFAULT_RETRY_AFTER):
+    """Return a Retry-After header (seconds or HTTP date) as a number of seconds"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.datetime.now(retry_at.tzinfo)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+# Shared by all catalog traffic so every request is paced by one limit
+NEXUS_LIMITER = AdaptiveConcurrencyLimiter()
+
+@contextlib.contextmanager
+def nexus_get(url, limiter=None, max_retries=NEXUS_MAX_RETRIES, **kwargs):
+    """GET a Nexus URL under the adaptive concurrency limit
+
+    The slot is held until the caller has finished with the response, so
+    streamed bodies count as in flight. 429/503 responses are retried after
+    the server's Retry-After delay.
+    """
+    limiter = limiter or NEXUS_LIMITER
+    for attempt in range(max_retries + 1):
+        slot = limiter.acquire()
+        try:
+            response = requests.get(url, **kwargs)
+        except requests.RequestException:
+            limiter.release(slot, error=True)
+            raise
+        latency = response.elapsed.total_seconds()
+        if response.status_code in (429, 503) and attempt < max_retries:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            print(f"Nexus returned {response.status_code}, retrying in {retry_after:.1f}s: {url}")
+            response.close()
+            limiter.release(slot, latency, overloaded=True, retry_after=retry_after)
+            continue
+        outcome = {'latency': latency, 'overloaded': response.status_code in (429, 503),
+                   'error': response.status_code >= 500}
+        try:
+            with response:
+                yield response
+        except requests.HTTPError:
+            # Status errors were already accounted for above
+            raise
+        except requests.RequestException:
+            outcome['error'] = True
+            raise
+        finally:
+            limiter.release(slot, **outcome)
+        return
+
+class SearchResponseStream:
+    """Incrementally parse a Nexus search response, keeping only selected item fields
+
+    The response body is read chunk by chunk. Each element of the top-level
+    'items' array is decoded on its own, projected down to `fields` and then
+    dropped, so assets, checksums and download URLs never accumulate in memory.
+    Other top-level keys (e.g. 'continuationToken') are kept as attributes once
+    iteration has finished.
+    """
+
+    _WHITESPACE = ' \t\n\r'
+    # Characters that can continue a JSON number
+    _NUMBER_CHARS = '0123456789+-.eE'
+
+    def __init__(self, chunks, fields=('name', 'version')):
+        self.chunks = iter(chunks)
+        self.fields = fields
+        self.continuation_token = None
+        self.extra = {}
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._exhausted = False
+
+    @classmethod
+    def from_response(cls, response, fields=('name', 'version'), chunk_size=STREAM_CHUNK_SIZE):
+        """Build a stream from a `requests` response opened with stream=True"""
+        return cls(response.iter_content(chunk_size=chunk_size), fields)
+
+    def _read_more(self):
+        """Append the next chunk to the buffer, returning False once the stream is done"""
+        if self._exhausted:
+            return False
+        # Drop everything already consumed so the buffer only holds unparsed text
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        for chunk in self.chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._utf8.decode(chunk)
+            if chunk:
+                self._buffer += chunk
+                return True
+        self._buffer += self._utf8.decode(b'', final=True)
+        self._exhausted = True
+        return False
+
+    def _next_char(self):
+        """Skip whitespace and return the next significant character without consuming it"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                raise ValueError('Unexpected end of search response')
+
+    def _expect(self, chars):
+        char = self._next_char()
+        if char not in chars:
+            raise ValueError(f'Malformed search response: expected one of {chars!r}, got {char!r}')
+        self._pos += 1
+        return char
+
+    def _decode_value(self):
+        """Decode one complete JSON value, reading more data until it is available"""
+        is_number = self._next_char() in self._NUMBER_CHARS
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A bare number cut off by the chunk boundary decodes as a shorter
+                # number (e.g. '1.' of '1.5e10'), so it is only complete once a
+                # character follows that cannot continue it
+                truncated = is_number and (end == len(self._buffer) or self._buffer[end] in self._NUMBER_CHARS)
+                if not truncated or self._exhausted:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            self._read_more()
+
+    def __iter__(self):
+        self._expect('{')
+        if self._next_char() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._decode_value()
+            self._expect(':')
+            if key == 'items':
+                yield from self._iter_items()
+            else:
+                value = self._decode_value()
+                if key == 'continuationToken':
+                    self.continuation_token = value
+                else:
+                    self.extra[key] = value
+            if self._expect(',}') == '}':
+                return
+
+    def _iter_items(self):
+        self._expect('[')
+        if self._next_char() == ']':
+            self._pos += 1
+            return
+        while True:
+            item = self._decode_value()
+            if isinstance(item, dict):
+                yield {field: item.get(field) for field in self.fields}
+            del item
+            if self._expect(',]') == ']':
+                return
+
+def fetch_search_page(url, params=None, fields=('name', 'version'), continuation_token=None,
+                      cancel_event=None, timeout=30):
+    """Fetch one page of search results, returning (items, next continuation token)
+
+    If `cancel_event` is set while the page is streaming, the connection is
+    closed and (None, None) is returned.
+    """
+    params = dict(params or {})
+    if continuation_token:
+        params['continuationToken'] = continuation_token
+    items = []
+    with nexus_get(url, params=params, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        stream = SearchResponseStream.from_response(response, fields)
+        for item in stream:
+            if cancel_event is not None and cancel_event.is_set():
+                return None, None
+            items.append(item)
+    return items, stream.continuation_token
+
+def stream_search_items(url, fields=('name', 'version'), timeout=30, params=None):
+    """GET a Nexus search URL and yield the requested fields of each item, following all pages"""
+    params = dict(params or {})
+    while True:
+        with nexus_get(url, params=params, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            stream = SearchResponseStream.from_response(response, fields)
+            yield from stream
+        if not stream.continuation_token:
+            return
+        params['continuationToken'] = stream.continuation_token
+
+def sort_versions(versions):
+    """Sort versions properly (handle semantic versioning)"""
+    try:
+        return sorted(versions, key=lambda v: [int(x) for x in v.split('.') if x.isdigit()])
+    except:
+        return sorted(versions)
+
+def group_package_versions(items):
+    """Group search items into [{'name', 'versions'}] in first-seen order"""
+    grouped = OrderedDict()
+    for item in items:
+        name = item.get('name')
+        if not name:
+            continue
+        versions = grouped.setdefault(name, [])
+        version = item.get('version')
+        if version and version not in versions:
+            versions.append(version)
+    return [{'name': name, 'versions': sort_versions(versions) or ['N/A']}
+            for name, versions in grouped.items()]
+
+class RemotePackageSearch:
+    """Search a repository through the Nexus search API, one page at a time
+
+    Results are cached per (query, continuation token) in a bounded LRU cache.
+    Only the most recent request is allowed to complete: starting a new one
+    (or calling cancel()) cancels whatever is still in flight.
+    """
+
+    def __init__(self, repository_name, cache_size=REMOTE_SEARCH_CACHE_SIZE):
+        self.repository_name = repository_name
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._cancel_event = None
+
+    def _cache_get(self, key):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        return None
+
+    def _cache_put(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def cancel(self):
+        """Cancel the in-flight request, if any"""
+        with self._lock:
+            if self._cancel_event is not None:
+                self._cancel_event.set()
+                self._cancel_event = None
+
+    def search_page(self, query, continuation_token=None, cancel_event=None):
+        """Return (packages, next continuation token), or None if the request was cancelled"""
+        key = (query, continuation_token)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        params = {'repository': self.repository_name}
+        if query:
+            # Keyword search matches package names as well as other component fields
+            params['q'] = query
+        print(f"Remote search in {self.repository_name}: q={query!r} page={continuation_token}")
+        items, next_token = fetch_search_page(VERSION_BASE_URL, params, continuation_token=continuation_token,
+                                              cancel_event=cancel_event)
+        if items is None:
+            return None
+        result = (group_package_versions(items), next_token)
+        self._cache_put(key, result)
+        return result
+
+    def search_async(self, query, continuation_token, on_result, on_error):
+        """Run search_page in a background thread, cancelling any earlier request
+
+        Callbacks run on the worker thread and are skipped if the request is cancelled.
+        """
+        cancel_event = threading.Event()
+        with self._lock:
+            if self._cancel_event is not None:
+                self._cancel_event.set()
+            self._cancel_event = cancel_event
+
+        def worker():
+            try:
+                result = self.search_page(query, continuation_token, cancel_event)
+            except Exception as e:
+                if not cancel_event.is_set():
+                    on_error(e)
+                return
+            if result is not None and not cancel_event.is_set():
+                on_result(*result)
+
+        search_thread = threading.Thread(target=worker)
+        search_thread.daemon = True
+        search_thread.start()
+        return cancel_event
+
+class CatalogStore:
+    """SQLite-backed package catalog with an FTS5 name index
+
+    Packages and their versions are stored in normalized tables per repository.
+    Name searches use an FTS5 trigram index when SQLite provides one and fall
+    back to LIKE otherwise. Whole catalogs can be exported to and imported from
+    snapshot files for machines without access to Nexus.
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS packages (
+            id INTEGER PRIMARY KEY,
+            repository TEXT NOT NULL,
+            name TEXT NOT NULL,
+            UNIQUE (repository, name)
+        );
+        CREATE TABLE IF NOT EXISTS versions (
+            package_id INTEGER NOT NULL REFERENCES packages(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            version TEXT NOT NULL,
+            PRIMARY KEY (package_id, version)
+        );
+        CREATE INDEX IF NOT EXISTS versions_by_position ON versions (package_id, position);
+        CREATE TABLE IF NOT EXISTS catalog_state (
+            repository TEXT PRIMARY KEY,
+            digest TEXT NOT NULL
+        );
+    '''
+
+    FTS_SCHEMA = '''
+        CREATE VIRTUAL TABLE IF NOT EXISTS package_names USING fts5(
+            name, content='packages', content_rowid='id', tokenize='trigram'
+        );
+        CREATE TRIGGER IF NOT EXISTS packages_ai AFTER INSERT ON packages BEGIN
+            INSERT INTO package_names (rowid, name) VALUES (new.id, new.name);
+        END;
+        CREATE TRIGGER IF NOT EXISTS packages_ad AFTER DELETE ON packages BEGIN
+            INSERT INTO package_names (package_names, rowid, name) VALUES ('delete', old.id, old.name);
+        END;
+    '''
+
+    # Trigram MATCH needs at least three characters; shorter text uses LIKE
+    FTS_MIN_QUERY = 3
+
+    def __init__(self, path):
+        if path == ':memory:' or not path:
+            # Writes come from worker threads on their own connections, which an
+            # in-memory database cannot be shared with
+            raise ValueError('CatalogStore needs a database file path')
+        self.path = path
+        # Used for reads on the Tk thread; writes may come from worker threads
+        self.conn = sqlite3.connect(path)
+        self._write_lock = threading.Lock()
+        self._init_schema()
+
+    def _init_schema(self):
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.executescript(self.SCHEMA)
+        try:
+            self.conn.executescript(self.FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError as e:
+            print(f"FTS5 trigram index not available, using LIKE search: {e}")
+            self.has_fts = False
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    @contextlib.contextmanager
+    def _writer(self):
+        """Connection for writes; safe to use from a worker thread"""
+        with self._write_lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                conn.execute('PRAGMA foreign_keys = ON')
+                yield conn
+            finally:
+                conn.close()
+
+    @staticmethod
+    def catalog_digest(packages):
+        data = json.dumps(sorted([pkg['name'], pkg['versions']] for pkg in packages))
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def upsert_packages(self, repository, packages):
+        """Replace the stored catalog of a repository with `packages` in one transaction
+
+        Returns False without writing anything if the catalog is unchanged.
+        May be called from a worker thread.
+        """
+        digest = self.catalog_digest(packages)
+        names = [pkg['name'] for pkg in packages]
+        with self._writer() as conn:
+            row = conn.execute('SELECT digest FROM catalog_state WHERE repository = ?', (repository,)).fetchone()
+            if row is not None and row[0] == digest:
+                print(f"Catalog for {repository} is unchanged")
+                return False
+            with conn:
+                conn.executemany('INSERT OR IGNORE INTO packages (repository, name) VALUES (?, ?)',
+                                 [(repository, name) for name in names])
+                ids = dict(conn.execute('SELECT name, id FROM packages WHERE repository = ?', (repository,)))
+                # Drop packages that are no longer in the repository
+                stale = [(ids.pop(name),) for name in set(ids) - set(names)]
+                conn.executemany('DELETE FROM packages WHERE id = ?', stale)
+                conn.execute('DELETE FROM versions WHERE package_id IN '
+                             '(SELECT id FROM packages WHERE repository = ?)', (repository,))
+                conn.executemany(
+                    'INSERT OR IGNORE INTO versions (package_id, position, version) VALUES (?, ?, ?)',
+                    ((ids[pkg['name']], position, version)
+                     for pkg in packages for position, version in enumerate(pkg['versions'])))
+                conn.execute('INSERT OR REPLACE INTO catalog_state (repository, digest) VALUES (?, ?)',
+                             (repository, digest))
+        print(f"Stored {len(names)} packages for {repository} in catalog database")
+        return True
+
+    def count(self, repository):
+        return self.conn.execute('SELECT COUNT(*) FROM packages WHERE repository = ?', (repository,)).fetchone()[0]
+
+    def search(self, repository, text='', limit=CATALOG_PAGE_SIZE, after_name=None):
+        """Return one page of packages whose name contains `text`, ordered by name
+
+        Pass the last name of the previous page as `after_name` to get the next page.
+        """
+        where = ['p.repository = ?']
+        params = [repository]
+        source = 'packages p'
+        if text and self.has_fts and len(text) >= self.FTS_MIN_QUERY:
+            # CROSS JOIN makes SQLite resolve the FTS match first instead of
+            # walking the whole repository and probing the index row by row
+            source = 'package_names f CROSS JOIN packages p ON p.id = f.rowid'
+            where.append('package_names MATCH ?')
+            params.append('"' + text.replace('"', '""') + '"')
+        elif text:
+            where.append("p.name LIKE ? ESCAPE '\\'")
+            params.append('%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%')
+        if after_name is not None:
+            where.append('p.name > ?')
+            params.append(after_name)
+        rows = self.conn.execute(
+            f"SELECT p.id, p.name FROM {source} WHERE {' AND '.join(where)} ORDER BY p.name LIMIT ?",
+            params + [limit]).fetchall()
+        return self._with_versions(rows)
+
+    def _with_versions(self, rows):
+        versions = {package_id: [] for package_id, _ in rows}
+        if rows:
+            placeholders = ','.join('?' * len(rows))
+            for package_id, version in self.conn.execute(
+                    f'SELECT package_id, version FROM versions WHERE package_id IN ({placeholders}) '
+                    'ORDER BY package_id, position', list(versions)):
+                versions[package_id].append(version)
+        return [{'name': name, 'versions': versions[package_id] or ['N/A']} for package_id, name in rows]
+
+    def export_snapshot(self, path):
+        """Write a consistent copy of the whole catalog to a snapshot file"""
+        if os.path.exists(path):
+            os.remove(path)
+        snapshot = sqlite3.connect(path)
+        try:
+            self.conn.backup(snapshot)
+        finally:
+            snapshot.close()
+
+    def import_snapshot(self, path):
+        """Replace the catalog with the contents of a snapshot file"""
+        snapshot = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+        try:
+            tables = {row[0] for row in snapshot.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            if not {'packages', 'versions'} <= tables:
+                raise ValueError(f'{path} is not a catalog snapshot')
+            snapshot.backup(self.conn)
+        finally:
+            snapshot.close()
+        # The snapshot may come from a SQLite build without FTS5
+        self._init_schema()
+        if self.has_fts:
+            with self.conn:
+                self.conn.execute("INSERT INTO package_names (package_names) VALUES ('rebuild')")
+
 # Fetch and group packages by name, versions as ids
-def fetch_packages(repository_key='dev'):
+def fetch_packages(repository_key='dev', remote_threshold=None, raise_errors=False):
+    """Load the full catalog of a repository
+
+    Raises RemoteSearchRequired as soon as more than `remote_threshold` package
+    names have been seen, so huge repositories are never fully preloaded.
+    With `raise_errors` failures are raised instead of shown in a dialog, so the
+    function can run off the Tk thread.
+    """
     try:
         # Get the appropriate URL for the repository
         api_url = API_URLS.get(repository_key, API_URLS['dev'])
@@ -50,138 +725,533 @@ def fetch_packages(repository_key='dev'):
         
         print(f"Fetching packages from: {api_url}")
         
-        # Fetch package names from the repository
-        response = requests.get(api_url, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        
-        packages = []
-        
-        # Extract unique package names from the response
+        # Extract unique package names from the response, streaming so that
+        # only the name of each item is ever held in memory
         package_names = set()
-        for item in data.get('items', []):
+        for item in stream_search_items(api_url, fields=('name',)):
             # Extract package name directly from the 'name' field
             package_name = item.get('name', '')
             if package_name:
                 package_names.add(package_name)
+            if remote_threshold is not None and len(package_names) > remote_threshold:
+                print(f"{repository_name} has more than {remote_threshold} packages, using remote search")
+                raise RemoteSearchRequired(repository_name)
         
         print(f"Found {len(package_names)} unique packages in {repository_name}")
         
-        # For each package name, fetch available versions
-        for package_name in package_names:
+        def fetch_versions(package_name):
             try:
                 # Get versions for this package using repository name directly
                 version_url = f"{VERSION_BASE_URL}?repository={repository_name}&name={package_name}"
                 
                 print(f"Fetching versions for {package_name} from: {version_url}")
                 
-                version_response = requests.get(version_url, timeout=30)
-                version_response.raise_for_status()
-                version_data = version_response.json()
-                
                 versions = []
-                for version_item in version_data.get('items', []):
+                for version_item in stream_search_items(version_url, fields=('version',)):
                     # Extract version directly from the 'version' field
                     version = version_item.get('version', '')
                     if version:
                         versions.append(version)
                 
                 if versions:
-                    # Sort versions properly (handle semantic versioning)
-                    try:
-                        sorted_versions = sorted(versions, key=lambda v: [int(x) for x in v.split('.') if x.isdigit()])
-                    except:
-                        sorted_versions = sorted(versions)
-                    
-                    packages.append({
-                        'name': package_name,
-                        'versions': sorted_versions
-                    })
+                    sorted_versions = sort_versions(versions)
                     print(f"Added {package_name} with {len(sorted_versions)} versions")
-                else:
-                    # Add package with default version if no versions found
-                    packages.append({
+                    return {
                         'name': package_name,
-                        'versions': ['N/A']
-                    })
-                    print(f"Added {package_name} with no versions (using N/A)")
+                        'versions': sorted_versions
+                    }
+                # Add package with default version if no versions found
+                print(f"Added {package_name} with no versions (using N/A)")
+                return {
+                    'name': package_name,
+                    'versions': ['N/A']
+                }
                     
             except Exception as e:
                 print(f"Error fetching versions for {package_name}: {e}")
                 # Add package with default version if version fetching fails
-                packages.append({
+                return {
                     'name': package_name,
                     'versions': ['N/A']
-                })
+                }
+        
+        # Fetch versions for all packages in parallel; NEXUS_LIMITER decides how
+        # many of these requests are actually in flight at once
+        with ThreadPoolExecutor(max_workers=NEXUS_MAX_CONCURRENCY) as executor:
+            packages = list(executor.map(fetch_versions, package_names))
         
         print(f"Total packages loaded for {repository_name}: {len(packages)}")
         return packages
         
+    except RemoteSearchRequired:
+        raise
     except Exception as e:
         error_msg = f'Failed to fetch packages for {repository_name}: {e}'
         print(error_msg)
+        if raise_errors:
+            raise
         messagebox.showerror('API Error', error_msg)
         return []
 
+def summarize_component(item):
+    """Reduce one search item (component with assets) to the details shown in the detail pane"""
+    assets = item.get('assets') or []
+    fmt = item.get('format') or ''
+    checksum = {}
+    description = ''
+    published = ''
+    size = 0
+    for asset in assets:
+        size += asset.get('fileSize') or 0
+        checksum = checksum or asset.get('checksum') or {}
+        # Nexus reports format-specific attributes (e.g. 'nuget') next to the asset fields
+        description = description or (asset.get(fmt) or {}).get('description') or ''
+        created = asset.get('blobCreated') or asset.get('lastModified') or ''
+        if created and (not published or created < published):
+            published = created
+    return {
+        'version': item.get('version') or 'N/A',
+        'size': size,
+        'published': published[:10],
+        'sha256': checksum.get('sha256') or '',
+        'sha1': checksum.get('sha1') or '',
+        'description': description or item.get('description') or '',
+    }
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024.0
+
+class PackageDetailCache:
+    """LRU cache of package details, bounded by the approximate size of its entries
+
+    Entries can be saved to and loaded from a JSON file so details survive
+    restarts; entries older than `ttl` seconds are treated as missing.
+    """
+
+    def __init__(self, max_bytes=DETAIL_CACHE_MAX_BYTES, ttl=DETAIL_CACHE_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry['fetched'] > self.ttl:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry['details']
+
+    def put(self, key, details, fetched=None):
+        entry = {'details': details, 'fetched': fetched or time.time()}
+        entry['bytes'] = len(json.dumps(details))
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self.total_bytes += entry['bytes']
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry['bytes']
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def save(self, path):
+        with self._lock:
+            data = [[repository, name, entry['fetched'], entry['details']]
+                    for (repository, name), entry in self._entries.items()]
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entries': data}, f)
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            # Oldest first so the most recently used entries end up most recent again
+            for repository, name, fetched, details in data.get('entries', []):
+                if time.time() - fetched <= self.ttl:
+                    self.put((repository, name), details, fetched)
+            print(f"Loaded {len(self._entries)} cached package details from {path}")
+        except Exception as e:
+            print(f"Ignoring unreadable detail cache {path}: {e}")
+
+class PackageDetailService:
+    """Fetch per-version component metadata on demand and prefetch likely next rows
+
+    Requests for the selected row run immediately; prefetches are handled by a
+    single background worker that only sends requests while the Nexus limiter
+    has no queue, so browsing never competes with catalog loading.
+    """
+
+    def __init__(self, pump, cache=None):
+        self.pump = pump
+        self.cache = cache or PackageDetailCache()
+        self._in_flight = {}
+        self._prefetch_queue = deque()
+        self._lock = threading.Lock()
+        self._prefetch_ready = threading.Condition(self._lock)
+        prefetch_thread = threading.Thread(target=self._prefetch_loop, name='DetailPrefetch')
+        prefetch_thread.daemon = True
+        prefetch_thread.start()
+
+    def fetch_details(self, repository, name):
+        """Fetch details for every version of a package (runs on a worker thread)"""
+        url = f"{VERSION_BASE_URL}?repository={repository}&name={name}"
+        print(f"Fetching details for {name} from: {url}")
+        details = [summarize_component(item)
+                   for item in stream_search_items(url, fields=('version', 'format', 'assets', 'description'))]
+        order = {version: i for i, version in enumerate(sort_versions({d['version'] for d in details}))}
+        details.sort(key=lambda d: order[d['version']])
+        return details
+
+    def get(self, repository, name, on_result, on_error=None):
+        """Deliver details to `on_result` on the Tk thread, from cache when possible"""
+        key = (repository, name)
+        details = self.cache.get(key)
+        if details is not None:
+            on_result(details)
+            return
+        with self._lock:
+            waiters = self._in_flight.get(key)
+            if waiters is not None:
+                # Already being fetched (e.g. by a prefetch): just wait for it
+                waiters.append((on_result, on_error))
+                return
+            self._in_flight[key] = [(on_result, on_error)]
+        detail_thread = threading.Thread(target=self._fetch, args=(key,))
+        detail_thread.daemon = True
+        detail_thread.start()
+
+    def prefetch(self, repository, names):
+        """Replace the pending prefetches with `names`, nearest rows first"""
+        with self._lock:
+            self._prefetch_queue.clear()
+            self._prefetch_queue.extend((repository, name) for name in names)
+            self._prefetch_ready.notify()
+
+    def _fetch(self, key):
+        try:
+            details = self.fetch_details(*key)
+            self.cache.put(key, details)
+            error = None
+        except Exception as e:
+            details, error = None, e
+        with self._lock:
+            waiters = self._in_flight.pop(key, [])
+        for on_result, on_error in waiters:
+            if error is None:
+                self.pump.post(lambda on_result=on_result: on_result(details))
+            elif on_error is not None:
+                self.pump.post(lambda on_error=on_error: on_error(error))
+
+    def _prefetch_loop(self):
+        while True:
+            with self._lock:
+                while not self._prefetch_queue:
+                    self._prefetch_ready.wait()
+                key = self._prefetch_queue.popleft()
+                if key in self._in_flight:
+                    continue
+            if key in self.cache:
+                continue
+            # Stay out of the way while other Nexus requests are waiting for a slot
+            while NEXUS_LIMITER.queue_depth:
+                time.sleep(0.2)
+            with self._lock:
+                if key in self._in_flight:
+                    continue
+                self._in_flight[key] = []
+            self._fetch(key)
+
+class UIUpdatePump:
+    """Deliver updates from worker threads to Tk in batches
+
+    Workers post callbacks from any thread; a single after() loop runs them on
+    the main thread at most UI_PUMP_FPS times a second. Posting with a key
+    replaces an update with the same key that has not run yet, so rapid status
+    changes for one row cost one widget update per frame.
+    """
+
+    def __init__(self, root, fps=UI_PUMP_FPS, budget_ms=UI_PUMP_BUDGET_MS):
+        self.root = root
+        self.interval_ms = max(1, int(1000 / fps))
+        self.budget = budget_ms / 1000.0
+        self._pending = OrderedDict()
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def start(self):
+        self.root.after(self.interval_ms, self._tick)
+
+    def post(self, callback, key=None):
+        """Queue `callback` to run on the Tk thread; safe to call from any thread"""
+        with self._lock:
+            if key is None:
+                self._sequence += 1
+                key = ('_unkeyed', self._sequence)
+            # A newer update for the same key replaces the queued one and runs
+            # after everything posted before it
+            self._pending.pop(key, None)
+            self._pending[key] = callback
+
+    def _tick(self):
+        with self._lock:
+            batch, self._pending = self._pending, OrderedDict()
+        deadline = time.monotonic() + self.budget
+        while batch:
+            if time.monotonic() > deadline:
+                # Out of time for this frame: put the rest back in front of newer updates
+                with self._lock:
+                    for key in reversed(batch):
+                        if key not in self._pending:
+                            self._pending[key] = batch[key]
+                            self._pending.move_to_end(key, last=False)
+                break
+            key, callback = batch.popitem(last=False)
+            try:
+                callback()
+            except Exception as e:
+                # A widget may have been destroyed since the update was posted
+                print(f"UI update failed: {e}")
+        self.root.after(self.interval_ms, self._tick)
+
+class JobSummary:
+    """Collects install/uninstall results in one non-modal window instead of a dialog per job"""
+
+    def __init__(self, root):
+        self.root = root
+        self.jobs = OrderedDict()
+        self.window = None
+        self.tree = None
+        self._next_id = 0
+
+    def start_job(self, action, package_name, version):
+        self._next_id += 1
+        job_id = self._next_id
+        self.jobs[job_id] = {
+            'action': action,
+            'package': package_name,
+            'version': version,
+            'status': 'Running',
+            'message': '',
+            'started': time.monotonic(),
+            'duration': None,
+        }
+        self._refresh(job_id)
+        return job_id
+
+    def finish_job(self, job_id, success, message):
+        job = self.jobs[job_id]
+        job['status'] = 'Succeeded' if success else 'Failed'
+        job['message'] = message
+        job['duration'] = time.monotonic() - job['started']
+        print(f"{job['action'].capitalize()} {job['package']}: {job['status']} - {message}")
+        # Open the summary the first time a job finishes; afterwards it is only updated
+        if self.window is None:
+            self.show()
+        else:
+            self._refresh(job_id)
+
+    def counts(self):
+        return Counter(job['status'] for job in self.jobs.values())
+
+    def show(self):
+        if self.window is not None:
+            self.window.deiconify()
+            self.window.lift()
+            return
+        self.window = tk.Toplevel(self.root)
+        self.window.title('Job Results')
+        self.window.geometry('650x300')
+        self.window.protocol('WM_DELETE_WINDOW', self._close)
+        self.totals_lbl = ttk.Label(self.window, text='')
+        self.totals_lbl.pack(fill='x', padx=8, pady=4)
+        columns = ('package', 'action', 'status', 'duration', 'message')
+        self.tree = ttk.Treeview(self.window, columns=columns, show='headings')
+        for column, width in zip(columns, (140, 70, 80, 70, 260)):
+            self.tree.heading(column, text=column.capitalize())
+            self.tree.column(column, width=width)
+        self.tree.tag_configure('Failed', foreground='red')
+        self.tree.pack(fill='both', expand=True, padx=8, pady=4)
+        for job_id in self.jobs:
+            self._refresh(job_id)
+
+    def _close(self):
+        self.window.destroy()
+        self.window = None
+        self.tree = None
+
+    def _refresh(self, job_id):
+        if self.tree is None:
+            return
+        job = self.jobs[job_id]
+        duration = f"{job['duration']:.0f}s" if job['duration'] is not None else ''
+        values = (f"{job['package']} {job['version']}".strip(), job['action'], job['status'], duration, job['message'])
+        item = str(job_id)
+        if self.tree.exists(item):
+            self.tree.item(item, values=values, tags=(job['status'],))
+        else:
+            self.tree.insert('', 'end', iid=item, values=values, tags=(job['status'],))
+        counts = self.counts()
+        self.totals_lbl.config(text=f"{counts['Running']} running, {counts['Succeeded']} succeeded, "
+                                    f"{counts['Failed']} failed")
+
 class PackageFrame(ttk.Frame):
-    def __init__(self, parent, package, *args, **kwargs):
+    def __init__(self, parent, package, row_state=None, fleet_enabled=False, on_select=None,
+                 find_row=None, repository_name=None, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.package = package
-        self.installed_version = None
-        self.selected_version = tk.StringVar(value=package['versions'][0])
+        self.fleet_enabled = fleet_enabled
+        self.on_select = on_select
+        # Looks up the row currently showing a package, since the tab may
+        # rebuild its rows while an install is running
+        self.find_row = find_row
+        self.repository_name = repository_name
+        # Row state lives in a dict owned by the tab so it survives widget rebuilds
+        self.row_state = row_state if row_state is not None else {}
+        self.row_state.setdefault('selected_version', package['versions'][0])
+        self.selected_version = tk.StringVar(value=self.row_state['selected_version'])
+        self.fleet_selected = tk.BooleanVar(value=self.row_state.get('fleet_selected', False))
         self.create_widgets()
         self.update_buttons()
 
+    @property
+    def installed_version(self):
+        return self.row_state.get('installed_version')
+
+    @installed_version.setter
+    def installed_version(self, version):
+        self.row_state['installed_version'] = version
+
+    @property
+    def is_busy(self):
+        """True while an install or uninstall for this row is running"""
+        return self.row_state.get('busy', False)
+
+    @is_busy.setter
+    def is_busy(self, value):
+        self.row_state['busy'] = value
+
+    def _remember_selection(self, event=None):
+        # Called from widget callbacks rather than variable traces: a trace holds
+        # a reference to this row in Tcl and would keep it alive after destroy()
+        self.row_state['selected_version'] = self.selected_version.get()
+        self.row_state['fleet_selected'] = self.fleet_selected.get()
+
     def create_widgets(self):
-        ttk.Label(self, text=self.package['name'], width=30).grid(row=0, column=0, padx=5, pady=2)
+        self.name_lbl = ttk.Label(self, text=self.package['name'], width=30)
+        self.name_lbl.grid(row=0, column=0, padx=5, pady=2)
+        if self.on_select:
+            # Clicking the name selects the row and shows its details
+            self.name_lbl.bind('<Button-1>', lambda e: self.on_select(self.package['name']))
         self.version_menu = ttk.Combobox(self, values=self.package['versions'], textvariable=self.selected_version, state='readonly', width=8)
         self.version_menu.grid(row=0, column=1, padx=5)
+        self.version_menu.bind('<<ComboboxSelected>>', self._remember_selection)
         self.install_btn = ttk.Button(self, text='Install', command=self.install)
         self.uninstall_btn = ttk.Button(self, text='Uninstall', command=self.uninstall)
         self.installed_lbl = ttk.Label(self, text='Installed', foreground='green')
         self.install_btn.grid(row=0, column=2, padx=5)
         self.uninstall_btn.grid(row=0, column=3, padx=5)
         self.installed_lbl.grid(row=0, column=4, padx=5)
+        status_text, status_color = self.row_state.get('status', ('', 'black'))
+        self.status_lbl = ttk.Label(self, text=status_text, foreground=status_color)
+        self.status_lbl.grid(row=0, column=5, padx=5)
+        if self.fleet_enabled:
+            # Tick packages to include in the next fleet deployment
+            ttk.Checkbutton(self, text='Fleet', variable=self.fleet_selected,
+                            command=self._remember_selection).grid(row=0, column=6, padx=5)
 
     def update_buttons(self):
-        if self.installed_version == self.selected_version.get():
+        if self.is_busy:
+            self.install_btn.state(['disabled'])
+            self.uninstall_btn.state(['disabled'])
+        elif self.installed_version == self.selected_version.get():
             self.install_btn.state(['disabled'])
             self.uninstall_btn.state(['!disabled'])
-            self.installed_lbl.grid()
         elif self.installed_version:
             self.install_btn.state(['!disabled'])
             self.uninstall_btn.state(['!disabled'])
-            self.installed_lbl.grid()
         else:
             self.install_btn.state(['!disabled'])
             self.uninstall_btn.state(['disabled'])
+        if self.installed_version:
+            self.installed_lbl.grid()
+        else:
             self.installed_lbl.grid_remove()
 
+    def set_selected(self, selected):
+        self.name_lbl.config(style='Selected.TLabel' if selected else 'TLabel')
+
+    def set_status(self, text, color='black'):
+        """Show a short status next to the row's buttons"""
+        self.row_state['status'] = (text, color)
+        self.status_lbl.config(text=text, foreground=color)
+
+    def refresh(self):
+        """Redraw the status and buttons from row_state"""
+        status_text, status_color = self.row_state.get('status', ('', 'black'))
+        self.status_lbl.config(text=status_text, foreground=status_color)
+        self.update_buttons()
+
+    def _job_finisher(self, job_id):
+        """Return a function that records a job's outcome without touching this widget
+
+        This row may be destroyed before the job ends (e.g. the search text
+        changed), so the outcome goes into row_state and the job summary, and
+        whichever row shows the package by then is refreshed.
+        """
+        app = self.winfo_toplevel()
+        pump, job_summary, row_state = app.ui_pump, app.job_summary, self.row_state
+        package_name = self.package['name']
+        find_row = self.find_row or (lambda name: self)
+        row_key = ('row', self.repository_name, package_name)
+
+        def refresh_row():
+            row = find_row(package_name)
+            if row is not None and row.winfo_exists():
+                row.refresh()
+
+        def finish(success, message, status=('', 'black'), **updates):
+            row_state['busy'] = False
+            row_state['status'] = status
+            row_state.update(updates)
+            job_summary.finish_job(job_id, success, message)
+            pump.post(refresh_row, key=row_key)
+
+        return finish
+
     def install(self):
         version = self.selected_version.get()
         package_name = self.package['name']
         
         try:
-            # Show progress dialog
-            progress_window = tk.Toplevel()
-            progress_window.title("Installing Package")
-            progress_window.geometry("400x200")
-            progress_window.transient(self.winfo_toplevel())
-            progress_window.grab_set()
-            
-            # Center the progress window
-            progress_window.geometry("+%d+%d" % (
-                self.winfo_toplevel().winfo_rootx() + 50,
-                self.winfo_toplevel().winfo_rooty() + 50))
+            app = self.winfo_toplevel()
+            pump = app.ui_pump
+            job_id = app.job_summary.start_job('install', package_name, version)
+            finish = self._job_finisher(job_id)
             
-            ttk.Label(progress_window, text=f"Installing {package_name} v{version}...").pack(pady=20)
-            progress = ttk.Progressbar(progress_window, mode='indeterminate')
-            progress.pack(pady=10, padx=20, fill='x')
-            progress.start()
+            # Progress is shown in the row and the job summary instead of a modal dialog
+            self.is_busy = True
+            self.set_status(f"Installing {version}...", 'blue')
+            self.update_buttons()
             
             # Use subprocess to run PowerShell command with visible window
             import subprocess
-            import threading
             
             def install_package():
                 try:
@@ -214,12 +1284,18 @@ class PackageFrame(ttk.Frame):
                     ], capture_output=False, timeout=10800)  # 3 hours timeout
                     
                     # Update UI in main thread
-                    self.after(0, lambda: self._install_complete(result, progress_window))
+                    if result.returncode == 0:
+                        pump.post(lambda: finish(True, f"Installed {package_name} v{version}",
+                                                 installed_version=version))
+                    else:
+                        pump.post(lambda: finish(False, 'Failed to install package. Check the PowerShell window for details.',
+                                                 ('Install failed', 'red')))
                     
                 except subprocess.TimeoutExpired:
-                    self.after(0, lambda: self._install_error("Installation timed out after 3 hours", progress_window))
+                    pump.post(lambda: finish(False, "Installation timed out after 3 hours", ('Install failed', 'red')))
                 except Exception as e:
-                    self.after(0, lambda: self._install_error(f"Installation failed: {e}", progress_window))
+                    error_msg = f"Installation failed: {e}"
+                    pump.post(lambda: finish(False, error_msg, ('Install failed', 'red')))
             
             # Run installation in background thread
             install_thread = threading.Thread(target=install_package)
@@ -227,48 +1303,25 @@ class PackageFrame(ttk.Frame):
             install_thread.start()
             
         except Exception as e:
+            self.is_busy = False
             messagebox.showerror('Install Error', f'Failed to start installation: {e}')
 
-    def _install_complete(self, result, progress_window):
-        """Handle installation completion"""
-        progress_window.destroy()
-        
-        if result.returncode == 0:
-            messagebox.showinfo('Install Success', f"Successfully installed {self.package['name']} v{self.selected_version.get()}")
-            self.installed_version = self.selected_version.get()
-            self.update_buttons()
-        else:
-            messagebox.showerror('Install Error', f'Failed to install package. Check the PowerShell window for details.')
-
-    def _install_error(self, error_msg, progress_window):
-        """Handle installation error"""
-        progress_window.destroy()
-        messagebox.showerror('Install Error', error_msg)
-
     def uninstall(self):
         package_name = self.package['name']
         
         try:
-            # Show progress dialog
-            progress_window = tk.Toplevel()
-            progress_window.title("Uninstalling Package")
-            progress_window.geometry("400x200")
-            progress_window.transient(self.winfo_toplevel())
-            progress_window.grab_set()
+            app = self.winfo_toplevel()
+            pump = app.ui_pump
+            job_id = app.job_summary.start_job('uninstall', package_name, self.installed_version or '')
+            finish = self._job_finisher(job_id)
             
-            # Center the progress window
-            progress_window.geometry("+%d+%d" % (
-                self.winfo_toplevel().winfo_rootx() + 50,
-                self.winfo_toplevel().winfo_rooty() + 50))
-            
-            ttk.Label(progress_window, text=f"Uninstalling {package_name}...").pack(pady=20)
-            progress = ttk.Progressbar(progress_window, mode='indeterminate')
-            progress.pack(pady=10, padx=20, fill='x')
-            progress.start()
+            # Progress is shown in the row and the job summary instead of a modal dialog
+            self.is_busy = True
+            self.set_status("Uninstalling...", 'blue')
+            self.update_buttons()
             
             # Use subprocess to run PowerShell command with visible window
             import subprocess
-            import threading
             
             def uninstall_package():
                 try:
@@ -295,12 +1348,17 @@ class PackageFrame(ttk.Frame):
                     ], capture_output=False, timeout=10800)  # 3 hours timeout
                     
                     # Update UI in main thread
-                    self.after(0, lambda: self._uninstall_complete(result, progress_window))
+                    if result.returncode == 0:
+                        pump.post(lambda: finish(True, f"Uninstalled {package_name}", installed_version=None))
+                    else:
+                        pump.post(lambda: finish(False, 'Failed to uninstall package. Check the PowerShell window for details.',
+                                                 ('Uninstall failed', 'red')))
                     
                 except subprocess.TimeoutExpired:
-                    self.after(0, lambda: self._uninstall_error("Uninstallation timed out after 3 hours", progress_window))
+                    pump.post(lambda: finish(False, "Uninstallation timed out after 3 hours", ('Uninstall failed', 'red')))
                 except Exception as e:
-                    self.after(0, lambda: self._uninstall_error(f"Uninstallation failed: {e}", progress_window))
+                    error_msg = f"Uninstallation failed: {e}"
+                    pump.post(lambda: finish(False, error_msg, ('Uninstall failed', 'red')))
             
             # Run uninstallation in background thread
             uninstall_thread = threading.Thread(target=uninstall_package)
@@ -308,33 +1366,162 @@ class PackageFrame(ttk.Frame):
             uninstall_thread.start()
             
         except Exception as e:
+            self.is_busy = False
             messagebox.showerror('Uninstall Error', f'Failed to start uninstallation: {e}')
 
-    def _uninstall_complete(self, result, progress_window):
-        """Handle uninstallation completion"""
-        progress_window.destroy()
-        
-        if result.returncode == 0:
-            messagebox.showinfo('Uninstall Success', f"Successfully uninstalled {self.package['name']}")
-            self.installed_version = None
-            self.update_buttons()
-        else:
-            messagebox.showerror('Uninstall Error', f'Failed to uninstall package. Check the PowerShell window for details.')
+class TabWithSearch(ttk.Frame):
+    """Searchable package list whose widgets are only built while the tab is in use
 
-    def _uninstall_error(self, error_msg, progress_window):
-        """Handle uninstallation error"""
-        progress_window.destroy()
-        messagebox.showerror('Uninstall Error', error_msg)
+    The catalog (`all_packages`), search text and per-row state are kept for the
+    lifetime of the tab; the widget tree can be released and rebuilt from them.
 
-class TabWithSearch(ttk.Frame):
-    def __init__(self, parent, all_packages, *args, **kwargs):
+    If the loader raises RemoteSearchRequired the tab switches to remote mode:
+    searches are sent to `remote_search` and further pages are loaded as the
+    list is scrolled. With a `catalog_store` the loaded catalog is written to
+    the database and the list is filled from paged queries against it, which
+    also keeps the tab usable when Nexus cannot be reached.
+    """
+
+    def __init__(self, parent, all_packages=None, loader=None, remote_search=None,
+                 catalog_store=None, repository_name=None, fleet_enabled=False, package_details=None,
+                 *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
+        self.fleet_enabled = fleet_enabled
+        self.package_details = package_details
+        self.selected_package = None
         self.all_packages = all_packages
-        self.filtered_packages = all_packages.copy()
+        self.loader = loader
+        self.remote_search = remote_search
+        self.catalog_store = catalog_store
+        self.repository_name = repository_name
+        self.store_mode = False
+        self.store_has_more = False
+        self.remote_mode = False
+        self.remote_query = None
+        self.remote_next_token = None
+        self.remote_loading = False
+        self.remote_debounce_id = None
+        # Bumped on every cancel so late results from stale requests are ignored
+        self.remote_generation = 0
+        self.filtered_packages = []
+        self.package_frames = {}
+        # Per-package row state (selected/installed version) keyed by package name
+        self.package_states = {}
+        self.materialized = False
+        self.loading = False
+        self.scroll_position = 0.0
         self.search_var = tk.StringVar()
         self.search_var.trace_add('write', self.update_filter)
+
+    def materialize(self):
+        """Build the tab's widgets, loading the catalog on first use"""
+        if self.materialized:
+            return
         self.create_widgets()
-        self.populate_packages()
+        self.materialized = True
+        if self.all_packages is None and self.catalog_store is not None and self.catalog_store.count(self.repository_name):
+            # Show the stored catalog right away and refresh it in the background
+            self.store_mode = True
+            self.start_loading()
+        if self.all_packages is None and not self.store_mode:
+            # The catalog is fetched on a worker thread; rows are built when it arrives
+            ttk.Label(self.scrollable_frame, text='Loading packages from Nexus...').grid(row=0, column=0, padx=8, pady=8)
+            self.status_lbl.config(text='Loading...')
+            self.start_loading()
+            return
+        self.show_catalog()
+
+    def start_loading(self):
+        if self.loading:
+            return
+        self.loading = True
+        pump = self.winfo_toplevel().ui_pump
+
+        catalog_store = self.catalog_store
+        repository_name = self.repository_name
+
+        def load_catalog():
+            packages, remote_required, error, changed = [], False, None, False
+            try:
+                packages = self.loader() if self.loader else []
+                # Writing a large catalog takes seconds, so it is done here rather than on the Tk thread
+                if catalog_store is not None and packages:
+                    changed = catalog_store.upsert_packages(repository_name, packages)
+            except RemoteSearchRequired:
+                remote_required = True
+            except Exception as e:
+                error = e
+            pump.post(lambda: self._catalog_loaded(packages, remote_required, error, changed))
+
+        load_thread = threading.Thread(target=load_catalog)
+        load_thread.daemon = True
+        load_thread.start()
+
+    def _catalog_loaded(self, packages, remote_required, error, changed=False):
+        """Take over the catalog fetched by start_loading (runs on the Tk thread)"""
+        self.loading = False
+        has_stored = self.catalog_store is not None and self.catalog_store.count(self.repository_name)
+        if error is not None:
+            if has_stored:
+                # Offline: the stored catalog is all we need, no dialog
+                print(f"Using stored catalog for {self.repository_name}: {error}")
+            else:
+                messagebox.showerror('API Error', f'Failed to fetch packages for {self.repository_name}: {error}')
+        was_store_mode = self.store_mode
+        self.all_packages = packages
+        self.remote_mode = remote_required and self.remote_search is not None
+        if self.catalog_store is not None:
+            self.use_catalog_store()
+        if was_store_mode and self.store_mode and not changed:
+            # The stored rows on screen are already current
+            return
+        if self.materialized:
+            self.status_lbl.config(text='')
+            self.show_catalog()
+
+    def show_catalog(self):
+        """Fill the list from the loaded catalog and restore the previous view"""
+        self.update_filter()
+        # Restore where the user was scrolled to before the tab was released
+        self.update_idletasks()
+        self.canvas.yview_moveto(self.scroll_position)
+        if self.selected_package:
+            self.select_package(self.selected_package)
+
+    def use_catalog_store(self):
+        """Serve the list from the catalog database once it holds this repository
+
+        The loader thread has already written any fetched catalog to the database.
+        """
+        if not self.catalog_store.count(self.repository_name):
+            # Nothing stored (e.g. the write failed): keep the in-memory list
+            return
+        # The database is now the catalog; drop the in-memory copy
+        self.all_packages = []
+        self.store_mode = True
+        if self.remote_mode:
+            self._cancel_remote_search()
+            self.remote_mode = False
+
+    def release(self):
+        """Destroy the tab's widgets while keeping catalog, search text and row state"""
+        if not self.materialized or self.has_busy_packages():
+            return False
+        self._cancel_remote_search()
+        self.scroll_position = self.canvas.yview()[0]
+        for widget in self.winfo_children():
+            widget.destroy()
+        self.package_frames = {}
+        self.materialized = False
+        return True
+
+    def fleet_packages(self):
+        """Return (name, version) for every package ticked for fleet deployment"""
+        return [(name, state['selected_version']) for name, state in self.package_states.items()
+                if state.get('fleet_selected')]
+
+    def has_busy_packages(self):
+        return any(state.get('busy') for state in self.package_states.values())
 
     def create_widgets(self):
         search_frame = ttk.Frame(self)
@@ -342,6 +1529,13 @@ class TabWithSearch(ttk.Frame):
         ttk.Label(search_frame, text='Search:').pack(side='left')
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side='left', padx=4)
+        self.status_lbl = ttk.Label(search_frame, text='')
+        self.status_lbl.pack(side='left', padx=4)
+        if self.package_details is not None:
+            # Details of the selected package, filled in lazily
+            ttk.Style(self).configure('Selected.TLabel', background='#cce0ff')
+            self.detail_text = tk.Text(self, height=8, wrap='word', state='disabled')
+            self.detail_text.pack(side='bottom', fill='x', padx=8, pady=4)
         # Scrollable area
         self.canvas = tk.Canvas(self)
         self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.canvas.yview)
@@ -351,45 +1545,722 @@ class TabWithSearch(ttk.Frame):
             lambda e: self.canvas.configure(scrollregion=self.canvas.bbox('all'))
         )
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor='nw')
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self.on_canvas_scroll)
         self.canvas.pack(side='left', fill='both', expand=True)
         self.scrollbar.pack(side='right', fill='y')
 
     def populate_packages(self):
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
-        for i, pkg in enumerate(self.filtered_packages):
-            pf = PackageFrame(self.scrollable_frame, pkg)
-            pf.grid(row=i, column=0, sticky='w', pady=4, padx=4)
+        self.package_frames = {}
+        self.append_packages(self.filtered_packages)
+
+    def append_packages(self, packages):
+        """Add rows for packages below the ones already shown"""
+        for pkg in packages:
+            row_state = self.package_states.setdefault(pkg['name'], {})
+            pf = PackageFrame(self.scrollable_frame, pkg, row_state, self.fleet_enabled,
+                              self.select_package if self.package_details is not None else None,
+                              lambda name: self.package_frames.get(name), self.repository_name)
+            if pkg['name'] == self.selected_package:
+                pf.set_selected(True)
+            pf.grid(row=len(self.package_frames), column=0, sticky='w', pady=4, padx=4)
+            self.package_frames[pkg['name']] = pf
+
+    def select_package(self, name):
+        """Highlight a row, show its details and prefetch the rows around it"""
+        previous = self.package_frames.get(self.selected_package)
+        if previous is not None:
+            previous.set_selected(False)
+        self.selected_package = name
+        current = self.package_frames.get(name)
+        if current is not None:
+            current.set_selected(True)
+        self.show_details(name, None)
+        self.package_details.get(self.repository_name, name,
+                                 lambda details: self.show_details(name, details),
+                                 lambda e: self.show_details(name, None, e))
+        names = [pkg['name'] for pkg in self.filtered_packages]
+        if name in names:
+            index = names.index(name)
+            neighbours = []
+            for offset in range(1, DETAIL_PREFETCH_NEIGHBOURS + 1):
+                neighbours.extend(names[i] for i in (index + offset, index - offset) if 0 <= i < len(names))
+            self.package_details.prefetch(self.repository_name, neighbours)
+
+    def show_details(self, name, details, error=None):
+        if not self.materialized or name != self.selected_package:
+            return
+        lines = [name, '']
+        if error is not None:
+            lines.append(f'Failed to load details: {error}')
+        elif details is None:
+            lines.append('Loading details...')
+        elif not details:
+            lines.append('No components found.')
+        else:
+            for detail in reversed(details):
+                checksum = f"sha256 {detail['sha256'][:16]}" if detail['sha256'] else (
+                    f"sha1 {detail['sha1'][:16]}" if detail['sha1'] else '')
+                lines.append(f"{detail['version']:<16} {format_size(detail['size']):>10}  "
+                             f"{detail['published'] or '-':<10}  {checksum}")
+            description = next((d['description'] for d in reversed(details) if d['description']), '')
+            if description:
+                lines.extend(['', description])
+        self.detail_text.config(state='normal')
+        self.detail_text.delete('1.0', 'end')
+        self.detail_text.insert('end', '\n'.join(lines))
+        self.detail_text.config(state='disabled')
+
+    def on_canvas_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self.store_mode and self.store_has_more and float(last) >= REMOTE_SEARCH_PREFETCH_FRACTION:
+            self.load_store_page()
+        # Fetch the next remote page once the user nears the bottom of the list
+        if (self.remote_mode and self.remote_next_token and not self.remote_loading
+                and float(last) >= REMOTE_SEARCH_PREFETCH_FRACTION):
+            self._start_remote_search(self.remote_next_token)
 
     def update_filter(self, *args):
+        # Search text is kept while released; the list is rebuilt on materialize
+        if not self.materialized:
+            return
+        if self.remote_mode:
+            self._schedule_remote_search()
+            return
+        if self.store_mode:
+            self.filtered_packages = []
+            self.populate_packages()
+            self.load_store_page()
+            return
+        if self.all_packages is None:
+            # Still loading; the filter is applied once the catalog arrives
+            return
         search_text = self.search_var.get().lower()
         self.filtered_packages = [pkg for pkg in self.all_packages if search_text in pkg['name'].lower()]
         self.populate_packages()
 
+    def load_store_page(self):
+        """Append the next page of catalog database results for the current search"""
+        after_name = self.filtered_packages[-1]['name'] if self.filtered_packages else None
+        packages = self.catalog_store.search(self.repository_name, self.search_var.get().strip(),
+                                             CATALOG_PAGE_SIZE, after_name)
+        self.store_has_more = len(packages) == CATALOG_PAGE_SIZE
+        self.filtered_packages.extend(packages)
+        self.append_packages(packages)
+        more = ' (scroll for more)' if self.store_has_more else ''
+        self.status_lbl.config(text=f'{len(self.filtered_packages)} packages{more}')
+
+    def _schedule_remote_search(self):
+        query = self.search_var.get().strip()
+        if query == self.remote_query and (self.filtered_packages or self.remote_loading):
+            # Rebuilding after a release: show the results we already have
+            self.populate_packages()
+            return
+        # Results for the previous text are stale as soon as the user types
+        self._cancel_remote_search()
+        self.remote_debounce_id = self.after(REMOTE_SEARCH_DEBOUNCE_MS, self._begin_remote_query)
+
+    def _begin_remote_query(self):
+        self.remote_debounce_id = None
+        self.remote_query = self.search_var.get().strip()
+        self.remote_next_token = None
+        self.filtered_packages = []
+        self.populate_packages()
+        self.canvas.yview_moveto(0)
+        self._start_remote_search(None)
+
+    def _start_remote_search(self, continuation_token):
+        self.remote_loading = True
+        self.status_lbl.config(text='Searching...')
+        generation = self.remote_generation
+        pump = self.winfo_toplevel().ui_pump
+        self.remote_search.search_async(
+            self.remote_query, continuation_token,
+            lambda packages, next_token: pump.post(lambda: self._remote_results(generation, packages, next_token)),
+            lambda e: pump.post(lambda: self._remote_error(generation, e)))
+
+    def _cancel_remote_search(self):
+        if self.remote_debounce_id is not None:
+            self.after_cancel(self.remote_debounce_id)
+            self.remote_debounce_id = None
+        if self.remote_search is not None:
+            self.remote_search.cancel()
+        self.remote_generation += 1
+        self.remote_loading = False
+
+    def _remote_results(self, generation, packages, next_token):
+        """Merge a page of remote results into the list"""
+        if not self.materialized or generation != self.remote_generation:
+            return
+        self.remote_loading = False
+        self.remote_next_token = next_token
+        new_packages = []
+        for pkg in packages:
+            pf = self.package_frames.get(pkg['name'])
+            if pf is None:
+                new_packages.append(pkg)
+                continue
+            # A package split across pages: add the versions from this page. The
+            # row gets a new dict since the old one is also in the search cache
+            versions = [v for v in pf.package['versions'] + pkg['versions'] if v != 'N/A']
+            merged = dict(pf.package, versions=sort_versions(set(versions)) or ['N/A'])
+            index = next(i for i, shown in enumerate(self.filtered_packages) if shown is pf.package)
+            self.filtered_packages[index] = pf.package = merged
+            pf.version_menu.config(values=merged['versions'])
+        self.filtered_packages.extend(new_packages)
+        self.append_packages(new_packages)
+        more = ' (scroll for more)' if next_token else ''
+        self.status_lbl.config(text=f'{len(self.filtered_packages)} packages{more}')
+
+    def _remote_error(self, generation, error):
+        if not self.materialized or generation != self.remote_generation:
+            return
+        self.remote_loading = False
+        self.status_lbl.config(text='Search failed')
+        print(f"Remote search failed: {error}")
+
+class FleetDispatcher:
+    """Send install/uninstall jobs to install agents (nexus_install_agent.py) on many hosts
+
+    Hosts are processed in parallel, one worker each; the jobs for a single host
+    run in order because its agent executes them one at a time anyway.
+    """
+
+    def __init__(self, hosts, token=FLEET_AGENT_TOKEN, timeout=FLEET_JOB_TIMEOUT):
+        self.hosts = list(hosts)
+        self.token = token
+        self.timeout = timeout
+
+    def _url(self, host, path):
+        if '://' not in host:
+            host = f'http://{host}'
+        return host.rstrip('/') + path
+
+    def _headers(self):
+        return {'X-Agent-Token': self.token} if self.token else {}
+
+    def check_health(self, host):
+        response = requests.get(self._url(host, '/health'), headers=self._headers(), timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    def check_hosts(self, on_result):
+        """Check every host's agent in the background, calling on_result(host, health_or_None)"""
+        def check(host):
+            try:
+                health = self.check_health(host)
+            except Exception as e:
+                print(f"Fleet host {host} is unreachable: {e}")
+                health = None
+            on_result(host, health)
+
+        def run_all():
+            with ThreadPoolExecutor(max_workers=max(1, len(self.hosts))) as executor:
+                list(executor.map(check, self.hosts))
+
+        health_thread = threading.Thread(target=run_all)
+        health_thread.daemon = True
+        health_thread.start()
+        return health_thread
+
+    @staticmethod
+    def _response_status(response):
+        """Describe an agent reply that was not a job result"""
+        if response.status_code == 401:
+            return 'Unauthorized'
+        if 400 <= response.status_code < 500:
+            return f'Rejected ({response.status_code})'
+        return f'Agent error ({response.status_code})'
+
+    def run_job(self, host, action, package_name, version):
+        """Run one job on one host and return its result, never raising
+
+        The result's 'status' says what happened: 'OK', 'Failed (<returncode>)',
+        'Unreachable' if the agent could not be contacted, or why the agent
+        refused the job (e.g. 'Unauthorized', 'Rejected (400)').
+        """
+        started = time.monotonic()
+        try:
+            response = requests.post(self._url(host, '/jobs'), headers=self._headers(), timeout=self.timeout,
+                                     json={'action': action, 'package': package_name, 'version': version})
+            if response.status_code == 200:
+                result = response.json()
+                result['host'] = host
+                result['status'] = 'OK' if result['returncode'] == 0 else f"Failed ({result['returncode']})"
+                return result
+            try:
+                error = response.json().get('error', response.text)
+            except ValueError:
+                error = response.text or response.reason
+            status = self._response_status(response)
+            log = f'{action} failed: agent returned {response.status_code}: {error}\n'
+        except (requests.ConnectionError, requests.Timeout) as e:
+            status, log = 'Unreachable', f'{action} failed: {e}\n'
+        except Exception as e:
+            status, log = 'Error', f'{action} failed: {e}\n'
+        return {
+            'host': host,
+            'action': action,
+            'package': package_name,
+            'version': version,
+            'returncode': None,
+            'status': status,
+            'log': log,
+            'duration': time.monotonic() - started,
+        }
+
+    def run_on_host(self, host, action, packages, on_result=None):
+        results = []
+        for package_name, version in packages:
+            result = self.run_job(host, action, package_name, version)
+            results.append(result)
+            if on_result:
+                on_result(result)
+        return results
+
+    def dispatch(self, action, packages, hosts=None, on_result=None, on_done=None):
+        """Run `action` for every (name, version) in `packages` on every host in the background
+
+        `on_result` is called for each finished job and `on_done` with all results;
+        both run on worker threads.
+        """
+        hosts = list(hosts if hosts is not None else self.hosts)
+
+        def run_all():
+            with ThreadPoolExecutor(max_workers=max(1, len(hosts))) as executor:
+                per_host = executor.map(lambda host: self.run_on_host(host, action, packages, on_result), hosts)
+                results = [result for host_results in per_host for result in host_results]
+            if on_done:
+                on_done(results)
+
+        dispatch_thread = threading.Thread(target=run_all)
+        dispatch_thread.daemon = True
+        dispatch_thread.start()
+        return dispatch_thread
+
+class FleetDialog(tk.Toplevel):
+    """Pick hosts, run the packages ticked for fleet deployment on them and show per-host results"""
+
+    def __init__(self, parent, dispatcher, packages):
+        super().__init__(parent)
+        self.title('Fleet Deployment')
+        self.geometry('700x500')
+        self.transient(parent)
+        self.dispatcher = dispatcher
+        self.packages = packages
+        self.results = {}
+        self.pending = 0
+        self.host_vars = {host: tk.BooleanVar(value=True) for host in dispatcher.hosts}
+        self.host_buttons = {}
+        self.create_widgets()
+        pump = self.master.ui_pump
+        dispatcher.check_hosts(lambda host, health: pump.post(lambda: self._host_checked(host, health)))
+
+    def create_widgets(self):
+        hosts_frame = ttk.LabelFrame(self, text='Hosts')
+        hosts_frame.pack(fill='x', padx=8, pady=4)
+        for i, (host, var) in enumerate(self.host_vars.items()):
+            button = ttk.Checkbutton(hosts_frame, text=host, variable=var)
+            button.grid(row=i // 4, column=i % 4, sticky='w', padx=5)
+            self.host_buttons[host] = button
+
+        package_text = ', '.join(f'{name} {version}' for name, version in self.packages) or 'none selected'
+        ttk.Label(self, text=f'Packages: {package_text}', wraplength=680).pack(fill='x', padx=8, pady=4)
+
+        button_frame = ttk.Frame(self)
+        button_frame.pack(fill='x', padx=8, pady=4)
+        self.install_btn = ttk.Button(button_frame, text='Install on Hosts', command=lambda: self.run('install'))
+        self.uninstall_btn = ttk.Button(button_frame, text='Uninstall on Hosts', command=lambda: self.run('uninstall'))
+        self.install_btn.pack(side='left')
+        self.uninstall_btn.pack(side='left', padx=4)
+        self.progress_lbl = ttk.Label(button_frame, text='')
+        self.progress_lbl.pack(side='left', padx=8)
+        if not self.packages:
+            self.install_btn.state(['disabled'])
+            self.uninstall_btn.state(['disabled'])
+
+        columns = ('host', 'package', 'action', 'status', 'duration')
+        self.results_tree = ttk.Treeview(self, columns=columns, show='headings', height=8)
+        for column in columns:
+            self.results_tree.heading(column, text=column.capitalize())
+            self.results_tree.column(column, width=120 if column in ('host', 'package') else 80)
+        self.results_tree.pack(fill='both', expand=True, padx=8, pady=4)
+        self.results_tree.bind('<<TreeviewSelect>>', self.show_log)
+
+        self.log_text = tk.Text(self, height=8, state='disabled')
+        self.log_text.pack(fill='both', padx=8, pady=4)
+
+    def _host_checked(self, host, health):
+        """Grey out a host whose agent did not answer the health check"""
+        if not self.winfo_exists():
+            return
+        button = self.host_buttons[host]
+        if health is None:
+            self.host_vars[host].set(False)
+            button.config(text=f'{host} (down)')
+            button.state(['disabled'])
+        elif health.get('busy'):
+            button.config(text=f'{host} (busy)')
+
+    def run(self, action):
+        hosts = [host for host, var in self.host_vars.items() if var.get()]
+        if not hosts:
+            messagebox.showerror('Fleet Deployment', 'Select at least one host', parent=self)
+            return
+        self.install_btn.state(['disabled'])
+        self.uninstall_btn.state(['disabled'])
+        self.pending = len(hosts) * len(self.packages)
+        self.progress_lbl.config(text=f'{self.pending} jobs running on {len(hosts)} hosts...')
+        print(f"Dispatching {action} of {len(self.packages)} packages to {len(hosts)} hosts")
+        pump = self.master.ui_pump
+        self.dispatcher.dispatch(
+            action, self.packages, hosts,
+            on_result=lambda result: (pump.post(lambda: self._job_complete(result)),
+                                      pump.post(self._update_progress, key=('fleet-progress', id(self)))),
+            on_done=lambda results: pump.post(lambda: self._dispatch_complete(results)))
+
+    def _job_complete(self, result):
+        """Show one finished job in the results table"""
+        self.pending -= 1
+        item = self.results_tree.insert('', 'end', values=(
+            result['host'], f"{result['package']} {result['version']}", result['action'], result['status'],
+            f"{result['duration']:.1f}s"))
+        self.results[item] = result
+
+    def _update_progress(self):
+        self.progress_lbl.config(text=f'{self.pending} jobs remaining...')
+
+    def _dispatch_complete(self, results):
+        failed_hosts = sorted({r['host'] for r in results if r['returncode'] != 0})
+        summary = f'{len(results) - sum(r["returncode"] != 0 for r in results)}/{len(results)} jobs succeeded'
+        if failed_hosts:
+            summary += f"; failures on {', '.join(failed_hosts)}"
+        self.progress_lbl.config(text=summary)
+        self.install_btn.state(['!disabled'])
+        self.uninstall_btn.state(['!disabled'])
+
+    def show_log(self, event=None):
+        selection = self.results_tree.selection()
+        if not selection:
+            return
+        result = self.results[selection[0]]
+        self.log_text.config(state='normal')
+        self.log_text.delete('1.0', 'end')
+        self.log_text.insert('end', result.get('log', ''))
+        self.log_text.config(state='disabled')
+
+class MainLoopWatchdog:
+    """Detect Tk main-loop stalls and attribute them to the handler that was running
+
+    An after() heartbeat records when the event loop last got to run. A helper
+    thread samples the main thread's stack whenever the heartbeat is overdue,
+    and once the loop catches up the stall is logged with the handler seen in
+    the samples. The most recent stalls are kept for report().
+    """
+
+    def __init__(self, root, heartbeat_ms=STALL_HEARTBEAT_MS, threshold_ms=STALL_THRESHOLD_MS,
+                 sample_ms=STALL_SAMPLE_MS, history=STALL_HISTORY_SIZE):
+        self.root = root
+        self.heartbeat = heartbeat_ms / 1000.0
+        self.threshold = threshold_ms / 1000.0
+        self.sample_interval = sample_ms / 1000.0
+        self.stalls = deque(maxlen=history)
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._samples = []
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self):
+        self._running = True
+        self._last_beat = time.monotonic()
+        self.root.after(int(self.heartbeat * 1000), self._beat)
+        sampler = threading.Thread(target=self._sample_loop, name='MainLoopWatchdog')
+        sampler.daemon = True
+        sampler.start()
+
+    def stop(self):
+        self._running = False
+
+    def _beat(self):
+        now = time.monotonic()
+        with self._lock:
+            lag = now - self._last_beat - self.heartbeat
+            samples, self._samples = self._samples, []
+            self._last_beat = now
+        if lag >= self.threshold:
+            self._record_stall(lag, samples)
+        if self._running:
+            self.root.after(int(self.heartbeat * 1000), self._beat)
+
+    def _sample_loop(self):
+        while self._running:
+            time.sleep(self.sample_interval)
+            with self._lock:
+                overdue = time.monotonic() - self._last_beat - self.heartbeat
+                if overdue < self.threshold or len(self._samples) >= STALL_MAX_SAMPLES:
+                    continue
+                frame = sys._current_frames().get(self._main_thread_id)
+                last_beat = self._last_beat
+            if frame is None:
+                continue
+            # Formatting reads source lines, so do it without holding up _beat
+            sample = self._describe_stack(frame)
+            with self._lock:
+                # Drop the sample if the stall ended while it was being formatted
+                if self._last_beat == last_beat and len(self._samples) < STALL_MAX_SAMPLES:
+                    self._samples.append(sample)
+
+    def _describe_stack(self, frame):
+        """Return (handler, location, formatted stack) for the main thread's current frame"""
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+        tk_dir = os.path.dirname(tk.__file__)
+
+        def in_tkinter(f):
+            return f.f_code.co_filename.startswith(tk_dir)
+
+        # The handler is the first of our frames called back from Tk; before the
+        # main loop runs there is none, so fall back to the outermost frame below
+        # the module level (e.g. NexusPackageManagerDemo.__init__)
+        handler = None
+        for outer, inner in zip(frames, frames[1:]):
+            if in_tkinter(outer) and not in_tkinter(inner):
+                handler = inner
+                break
+        if handler is None:
+            handler = next((f for f in frames if f.f_code.co_name != '<module>'), frames[-1])
+        # Location is the innermost frame in this file, i.e. where our code is stuck
+        location = next((f for f in reversed(frames) if f.f_code.co_filename == __file__), frames[-1])
+        stack = ''.join(traceback.format_list(traceback.extract_stack(frames[-1])))
+        return self._frame_name(handler), self._frame_name(location), stack
+
+    @staticmethod
+    def _frame_name(frame):
+        code = frame.f_code
+        name = getattr(code, 'co_qualname', code.co_name)
+        return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _record_stall(self, duration, samples):
+        if samples:
+            # Attribute the stall to the handler seen in most samples
+            handler = Counter(sample[0] for sample in samples).most_common(1)[0][0]
+            location = Counter(sample[1] for sample in samples if sample[0] == handler).most_common(1)[0][0]
+            stack = next(sample[2] for sample in samples if sample[0] == handler)
+        else:
+            handler, location, stack = 'unknown', 'unknown', ''
+        self.stalls.append({
+            'handler': handler,
+            'location': location,
+            'duration': duration,
+            'stack': stack,
+            'time': time.time(),
+        })
+        print(f"Main loop stalled for {duration * 1000:.0f}ms in {handler} at {location}")
+
+    def worst_offenders(self, limit=10):
+        """Aggregate recent stalls per handler, worst total blocking time first"""
+        offenders = {}
+        for stall in list(self.stalls):
+            entry = offenders.setdefault(stall['handler'], {
+                'handler': stall['handler'], 'count': 0, 'total': 0.0, 'worst': 0.0,
+                'locations': Counter(), 'stack': ''})
+            entry['count'] += 1
+            entry['total'] += stall['duration']
+            entry['locations'][stall['location']] += 1
+            if stall['duration'] >= entry['worst']:
+                entry['worst'] = stall['duration']
+                entry['stack'] = stall['stack']
+        return sorted(offenders.values(), key=lambda e: e['total'], reverse=True)[:limit]
+
+    def report(self, limit=10, stacks=True):
+        """Format the worst offenders as text"""
+        offenders = self.worst_offenders(limit)
+        if not offenders:
+            return f'No main loop stalls over {self.threshold * 1000:.0f}ms recorded.'
+        lines = [f'Main loop stalls over {self.threshold * 1000:.0f}ms (last {len(self.stalls)} recorded):', '']
+        for entry in offenders:
+            lines.append(f"{entry['handler']}: {entry['count']} stalls, {entry['total'] * 1000:.0f}ms total, "
+                         f"worst {entry['worst'] * 1000:.0f}ms")
+            for location, count in entry['locations'].most_common(3):
+                lines.append(f'    at {location} ({count}x)')
+            if stacks and entry['stack']:
+                lines.append('    stack of worst stall:')
+                lines.extend('      ' + line for line in entry['stack'].rstrip().splitlines())
+            lines.append('')
+        return '\n'.join(lines)
+
 class NexusPackageManagerDemo(tk.Tk):
-    def __init__(self):
+    def __init__(self, tab_idle_seconds=TAB_IDLE_RELEASE_SECONDS, catalog_db_path=CATALOG_DB_PATH,
+                 fleet_hosts=FLEET_HOSTS):
         super().__init__()
+        # Started first so slow startup work is caught as well
+        self.watchdog = MainLoopWatchdog(self)
+        self.watchdog.start()
         self.title('Nexus Package Manager Demo')
         self.geometry('700x600')
+        # All worker-thread results reach the widgets through this pump
+        self.ui_pump = UIUpdatePump(self)
+        self.ui_pump.start()
+        self.job_summary = JobSummary(self)
+        detail_cache = PackageDetailCache()
+        if DETAIL_CACHE_PATH:
+            detail_cache.load(DETAIL_CACHE_PATH)
+        self.package_details = PackageDetailService(self.ui_pump, detail_cache)
+        self.protocol('WM_DELETE_WINDOW', self.on_close)
+        self.tab_idle_seconds = tab_idle_seconds
+        self.catalog_store = CatalogStore(catalog_db_path) if catalog_db_path else None
+        self.fleet_dispatcher = FleetDispatcher(fleet_hosts) if fleet_hosts else None
+        self.create_menu()
+        # Monotonic time at which each tab was last hidden
+        self.tab_hidden_since = {}
         self.pack_logo()
         
         # Show loading screen
         self.show_loading_screen()
         
+        # Status line showing how hard we are currently driving Nexus
+        self.nexus_status_lbl = ttk.Label(self, text='', anchor='w')
+        self.nexus_status_lbl.pack(side='bottom', fill='x', padx=8, pady=2)
+        
         # Create notebook after loading
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill='both', expand=True)
         
-        # Create tabs for different repositories
+        # Create tabs for different repositories; packages and widgets are
+        # only loaded when a tab is first selected
         repositories = ['dev', 'test', 'prod']
         for repo in repositories:
-            packages = fetch_packages(repo)
-            tab = TabWithSearch(self.notebook, packages)
+            repository_name = REPOSITORY_NAMES.get(repo, 'nuget-dev')
+            tab = TabWithSearch(self.notebook,
+                                loader=lambda repo=repo: fetch_packages(repo, remote_threshold=REMOTE_SEARCH_THRESHOLD,
+                                                                       raise_errors=True),
+                                remote_search=RemotePackageSearch(repository_name),
+                                catalog_store=self.catalog_store,
+                                repository_name=repository_name,
+                                fleet_enabled=self.fleet_dispatcher is not None,
+                                package_details=self.package_details)
             self.notebook.add(tab, text=repo.capitalize())
+            self.tab_hidden_since[tab] = time.monotonic()
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+        
+        # Build the initially selected tab now
+        self.on_tab_changed()
         
         # Hide loading screen
         self.hide_loading_screen()
+        
+        self.after(TAB_RECLAIM_CHECK_MS, self.reclaim_idle_tabs)
+        self.update_nexus_status()
+
+    def on_close(self):
+        """Stop the stall watchdog and persist the package detail cache before the window closes"""
+        self.watchdog.stop()
+        if DETAIL_CACHE_PATH:
+            try:
+                self.package_details.cache.save(DETAIL_CACHE_PATH)
+            except Exception as e:
+                print(f"Failed to save detail cache: {e}")
+        self.destroy()
+
+    def on_tab_changed(self, event=None):
+        """Materialize the selected tab and start the idle clock on the others"""
+        selected = self.nametowidget(self.notebook.select())
+        now = time.monotonic()
+        for tab in self.tab_hidden_since:
+            if tab is selected:
+                self.tab_hidden_since[tab] = None
+            elif self.tab_hidden_since[tab] is None:
+                self.tab_hidden_since[tab] = now
+        selected.materialize()
+
+    def create_menu(self):
+        """Add menus for the optional catalog database and fleet features, and diagnostics"""
+        menubar = tk.Menu(self)
+        if self.catalog_store is not None:
+            catalog_menu = tk.Menu(menubar, tearoff=0)
+            catalog_menu.add_command(label='Export Snapshot...', command=self.export_catalog_snapshot)
+            catalog_menu.add_command(label='Import Snapshot...', command=self.import_catalog_snapshot)
+            menubar.add_cascade(label='Catalog', menu=catalog_menu)
+        if self.fleet_dispatcher is not None:
+            fleet_menu = tk.Menu(menubar, tearoff=0)
+            fleet_menu.add_command(label='Deploy Selected Packages...', command=self.open_fleet_dialog)
+            menubar.add_cascade(label='Fleet', menu=fleet_menu)
+        jobs_menu = tk.Menu(menubar, tearoff=0)
+        jobs_menu.add_command(label='Job Results...', command=self.job_summary.show)
+        menubar.add_cascade(label='Jobs', menu=jobs_menu)
+        diagnostics_menu = tk.Menu(menubar, tearoff=0)
+        diagnostics_menu.add_command(label='Responsiveness Report...', command=self.show_stall_report)
+        menubar.add_cascade(label='Diagnostics', menu=diagnostics_menu)
+        self.config(menu=menubar)
+
+    def show_stall_report(self):
+        """Show the main-loop watchdog's worst offenders"""
+        report_window = tk.Toplevel(self)
+        report_window.title('Responsiveness Report')
+        report_window.geometry('700x400')
+        report_text = tk.Text(report_window, wrap='none')
+        report_text.insert('end', self.watchdog.report())
+        report_text.config(state='disabled')
+        report_text.pack(fill='both', expand=True)
+
+    def open_fleet_dialog(self):
+        packages = []
+        for tab in self.tab_hidden_since:
+            for package in tab.fleet_packages():
+                if package not in packages:
+                    packages.append(package)
+        FleetDialog(self, self.fleet_dispatcher, packages)
+
+    def export_catalog_snapshot(self):
+        path = filedialog.asksaveasfilename(title='Export Catalog Snapshot', defaultextension='.db',
+                                            filetypes=[('Catalog snapshot', '*.db'), ('All files', '*.*')])
+        if not path:
+            return
+        try:
+            self.catalog_store.export_snapshot(path)
+            messagebox.showinfo('Export Snapshot', f'Catalog exported to {path}')
+        except Exception as e:
+            messagebox.showerror('Export Snapshot', f'Failed to export catalog: {e}')
+
+    def import_catalog_snapshot(self):
+        path = filedialog.askopenfilename(title='Import Catalog Snapshot',
+                                          filetypes=[('Catalog snapshot', '*.db'), ('All files', '*.*')])
+        if not path:
+            return
+        try:
+            self.catalog_store.import_snapshot(path)
+        except Exception as e:
+            messagebox.showerror('Import Snapshot', f'Failed to import catalog: {e}')
+            return
+        # Refill loaded tabs from the imported catalog
+        for tab in self.tab_hidden_since:
+            if tab.all_packages is not None or tab.store_mode:
+                tab.use_catalog_store()
+                tab.update_filter()
+        messagebox.showinfo('Import Snapshot', f'Catalog imported from {path}')
+
+    def update_nexus_status(self):
+        """Refresh the request limiter status line once a second"""
+        stats = NEXUS_LIMITER.stats()
+        text = f"Nexus requests: {stats['in_flight']} in flight, limit {stats['limit']}, {stats['queue_depth']} queued"
+        if stats['paused_for']:
+            text += f" (server asked to wait {stats['paused_for']:.0f}s)"
+        self.nexus_status_lbl.config(text=text)
+        self.after(1000, self.update_nexus_status)
+
+    def reclaim_idle_tabs(self):
+        """Release widget trees of tabs hidden for longer than the idle period"""
+        now = time.monotonic()
+        for tab, hidden_since in self.tab_hidden_since.items():
+            if hidden_since is not None and now - hidden_since >= self.tab_idle_seconds:
+                if tab.materialized and tab.release():
+                    print(f"Released idle tab: {self.notebook.tab(tab, 'text')}")
+        self.after(TAB_RECLAIM_CHECK_MS, self.reclaim_idle_tabs)
 
     def show_loading_screen(self):
         """Show loading screen while fetching packages"""
@@ -483,4 +2354,5 @@ if __name__ == '__main__':
         messagebox.showerror('Missing Dependency', 'Please install Pillow: pip install pillow')
         exit(1)
     app = NexusPackageManagerDemo()
-    app.mainloop() 
\ No newline at end of file
+    app.mainloop()
+    print(app.watchdog.report(stacks=False)) 
\ No newline at end of file
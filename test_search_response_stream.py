@@ -0,0 +1,63 @@
+"""Check SearchResponseStream against json.loads for every way a response can be chunked
+
+Usage:
+    python -m pytest test_search_response_stream.py
+"""
+import json
+import unittest
+
+from nexus_package_manager_demo_nexus import SearchResponseStream
+
+DOCUMENTS = [
+    '{}',
+    '{"items": []}',
+    '{"items": [], "continuationToken": null}',
+    '{"foo": 1.5e10, "items": [{"name": "A", "version": "1.0"}], "continuationToken": "abc"}',
+    '{"count": -0.25E-3, "total": 12, "items": [{"name": "B", "version": "2.0", "size": 1e5}], "n": 7}',
+    '{"flag": true, "other": false, "none": null, "items": [{"name": "C", "version": null}]}',
+    ' { "items" : [ { "name" : "D" , "version" : "3" } , { "version" : "4" , "name" : "E" } ] } ',
+    '{"items": [{"name": "Pakét", "version": "1.0-β"}, {"name": "日本語", "version": "2"}],'
+    ' "continuationToken": "\U0001f4e6"}',
+    '{"items": [{"name": "Esc\\"aped\\\\", "version": "\\u00e9", "assets": [{"fileSize": 3.25e2, "x": [1, 2.5]}]}],'
+    ' "nested": {"a": [1, {"b": -3}]}}',
+    '{"items": [1, "skip", {"name": "F", "version": "5"}, null], "tail": 0}',
+]
+
+CHUNK_SIZES = list(range(1, 17)) + [31, 64, 1000]
+
+def expected_result(document, fields):
+    data = json.loads(document)
+    items = [{field: item.get(field) for field in fields} for item in data.get('items', []) if isinstance(item, dict)]
+    extra = {key: value for key, value in data.items() if key not in ('items', 'continuationToken')}
+    return items, data.get('continuationToken'), extra
+
+def byte_chunks(document, size):
+    body = document.encode('utf-8')
+    return [body[start:start + size] for start in range(0, len(body), size)]
+
+class SearchResponseStreamTest(unittest.TestCase):
+    def test_matches_json_loads_for_every_chunk_size(self):
+        fields = ('name', 'version')
+        for document in DOCUMENTS:
+            expected = expected_result(document, fields)
+            for size in CHUNK_SIZES:
+                with self.subTest(document=document, chunk_size=size):
+                    stream = SearchResponseStream(byte_chunks(document, size), fields)
+                    items = list(stream)
+                    self.assertEqual((items, stream.continuation_token, stream.extra), expected)
+
+    def test_text_chunks(self):
+        document = DOCUMENTS[7]
+        chunks = [document[start:start + 3] for start in range(0, len(document), 3)]
+        stream = SearchResponseStream(chunks)
+        self.assertEqual(list(stream), expected_result(document, ('name', 'version'))[0])
+
+    def test_malformed_response_raises(self):
+        for document in ('{"items": [{"name": "A"}', '{"items": [1 2]}', '{"a": 1.x}', '[]'):
+            for size in (1, 4, 1000):
+                with self.subTest(document=document, chunk_size=size):
+                    with self.assertRaises(ValueError):
+                        list(SearchResponseStream(byte_chunks(document, size)))
+
+if __name__ == '__main__':
+    unittest.main()